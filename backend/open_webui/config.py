@@ -2463,3 +2463,11 @@ LDAP_CA_CERT_FILE = PersistentConfig(
 LDAP_CIPHERS = PersistentConfig(
     "LDAP_CIPHERS", "ldap.server.ciphers", os.environ.get("LDAP_CIPHERS", "ALL")
 )
+
+LDAP_BACKEND = PersistentConfig(
+    "LDAP_BACKEND",
+    "ldap.backend",
+    # "python-ldap" uses the C libldap client when installed; "ldap3" is the
+    # pure-python fallback
+    os.environ.get("LDAP_BACKEND", "ldap3"),
+)
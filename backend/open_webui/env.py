@@ -412,6 +412,15 @@ else:
         AIOHTTP_CLIENT_TIMEOUT_MODEL_LIST = 5
 
 
+####################################
+# AUTH
+####################################
+
+try:
+    BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS") or 10)
+except ValueError:
+    BCRYPT_ROUNDS = 10
+
 ####################################
 # OFFLINE_MODE
 ####################################
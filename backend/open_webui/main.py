@@ -278,6 +278,7 @@ from open_webui.config import (
     LDAP_USE_TLS,
     LDAP_CA_CERT_FILE,
     LDAP_CIPHERS,
+    LDAP_BACKEND,
     # Misc
     ENV,
     CACHE_DIR,
@@ -346,9 +347,12 @@ from open_webui.utils.access_control import has_access
 from open_webui.utils.auth import (
     get_license_data,
     decode_token,
+    flush_last_active,
+    periodic_last_active_flush,
     get_admin_user,
     get_verified_user,
 )
+from open_webui.utils.http import close_http_session
 from open_webui.utils.oauth import OAuthManager
 from open_webui.utils.security_headers import SecurityHeadersMiddleware
 
@@ -403,11 +407,16 @@ async def lifespan(app: FastAPI):
         reset_config()
 
     if LICENSE_KEY:
-        get_license_data(app, LICENSE_KEY)
+        await get_license_data(app, LICENSE_KEY)
 
     asyncio.create_task(periodic_usage_pool_cleanup())
+    asyncio.create_task(periodic_last_active_flush())
+    asyncio.create_task(auths.warm_openid_config())
     yield
 
+    await asyncio.to_thread(flush_last_active)
+    await close_http_session()
+
 
 app = FastAPI(
     docs_url="/docs" if ENV == "dev" else None,
@@ -518,6 +527,7 @@ app.state.config.LDAP_SEARCH_FILTERS = LDAP_SEARCH_FILTERS
 app.state.config.LDAP_USE_TLS = LDAP_USE_TLS
 app.state.config.LDAP_CA_CERT_FILE = LDAP_CA_CERT_FILE
 app.state.config.LDAP_CIPHERS = LDAP_CIPHERS
+app.state.config.LDAP_BACKEND = LDAP_BACKEND
 
 
 app.state.AUTH_TRUSTED_EMAIL_HEADER = WEBUI_AUTH_TRUSTED_EMAIL_HEADER
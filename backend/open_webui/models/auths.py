@@ -7,7 +7,7 @@ from open_webui.models.users import UserModel, Users
 from open_webui.env import SRC_LOG_LEVELS
 from pydantic import BaseModel
 from sqlalchemy import Boolean, Column, String, Text
-from open_webui.utils.auth import verify_password
+from open_webui.utils.auth import verify_password_and_update
 
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MODELS"])
@@ -127,13 +127,62 @@ class AuthsTable:
             else:
                 return None
 
+    def insert_new_auth_if_absent(
+        self,
+        email: str,
+        password: str,
+        name: str,
+        profile_image_url: str = "/user.png",
+        role: str = "pending",
+        oauth_sub: Optional[str] = None,
+    ) -> Optional[UserModel]:
+        with get_db() as db:
+            log.info("insert_new_auth_if_absent")
+
+            # Existence check and insert share one transaction, which narrows
+            # (but does not close) the duplicate-signup window: auth.email has
+            # no unique constraint, so two transactions can still both pass
+            # this check and commit
+            if db.query(Auth).filter_by(email=email).first():
+                return None
+
+            id = str(uuid.uuid4())
+
+            auth = AuthModel(
+                **{"id": id, "email": email, "password": password, "active": True}
+            )
+            result = Auth(**auth.model_dump())
+            db.add(result)
+
+            user = Users.insert_new_user(
+                id, name, email, profile_image_url, role, oauth_sub
+            )
+
+            db.commit()
+            db.refresh(result)
+
+            if result and user:
+                return user
+            else:
+                return None
+
     def authenticate_user(self, email: str, password: str) -> Optional[UserModel]:
         log.info(f"authenticate_user: {email}")
         try:
             with get_db() as db:
                 auth = db.query(Auth).filter_by(email=email, active=True).first()
                 if auth:
-                    if verify_password(password, auth.password):
+                    valid, new_hash = verify_password_and_update(
+                        password, auth.password
+                    )
+                    if valid:
+                        if new_hash:
+                            # Stored hash uses a deprecated scheme; replace it
+                            # now that we hold the verified plaintext
+                            db.query(Auth).filter_by(id=auth.id).update(
+                                {"password": new_hash}
+                            )
+                            db.commit()
                         user = Users.get_user_by_id(auth.id)
                         return user
                     else:
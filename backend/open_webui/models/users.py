@@ -233,6 +233,19 @@ class UsersTable:
         except Exception:
             return None
 
+    def update_users_last_active(self, timestamps: dict) -> bool:
+        # Flush a batch of user id -> last_active_at stamps in one transaction
+        try:
+            with get_db() as db:
+                for id, last_active_at in timestamps.items():
+                    db.query(User).filter_by(id=id).update(
+                        {"last_active_at": last_active_at}
+                    )
+                db.commit()
+                return True
+        except Exception:
+            return False
+
     def update_user_last_active_by_id(self, id: str) -> Optional[UserModel]:
         try:
             with get_db() as db:
@@ -246,18 +259,18 @@ class UsersTable:
         except Exception:
             return None
 
-    def update_user_oauth_sub_by_id(
-        self, id: str, oauth_sub: str
-    ) -> Optional[UserModel]:
+    def update_user_oauth_sub_by_id(self, id: str, oauth_sub: str) -> bool:
+        # Single UPDATE round-trip; callers patch their in-memory user model
+        # instead of re-reading the row
         try:
             with get_db() as db:
-                db.query(User).filter_by(id=id).update({"oauth_sub": oauth_sub})
+                result = (
+                    db.query(User).filter_by(id=id).update({"oauth_sub": oauth_sub})
+                )
                 db.commit()
-
-                user = db.query(User).filter_by(id=id).first()
-                return UserModel.model_validate(user)
+                return result == 1
         except Exception:
-            return None
+            return False
 
     def update_user_by_id(self, id: str, updated: dict) -> Optional[UserModel]:
         try:
@@ -1,9 +1,11 @@
 import re
 import uuid
 import time
-import datetime
 import logging
-from aiohttp import ClientSession
+import asyncio
+import threading
+from open_webui.utils.http import get_http_session
+from cachetools import TTLCache
 
 from open_webui.models.auths import (
     AddUserForm,
@@ -40,24 +42,64 @@ from open_webui.utils.auth import (
     get_admin_user,
     get_verified_user,
     get_current_user,
-    get_password_hash,
+    get_password_hash_async,
+    invalidate_api_key_cache,
+    invalidate_token_cache,
+    invalidate_user_cache,
 )
 from open_webui.utils.webhook import post_webhook
 from open_webui.utils.access_control import get_permissions
 
+from dataclasses import dataclass
 from typing import Optional, List
 
 from ssl import CERT_REQUIRED, PROTOCOL_TLS
 
 if ENABLE_LDAP.value:
-    from ldap3 import Server, Connection, NONE, Tls
+    from ldap3 import Server, Connection, NONE, SUBTREE, Tls
     from ldap3.utils.conv import escape_filter_chars
 
 router = APIRouter()
 
+_JWT_EXPIRES_RE = re.compile(r"^(-1|0|(-?\d+(\.\d+)?)(ms|s|m|h|d|w))$")
+
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MAIN"])
 
+# The OpenID discovery document changes rarely; cache it so signout doesn't
+# pay an outbound round-trip to the identity provider on every call.
+_openid_cache = TTLCache(maxsize=4, ttl=3600)
+
+
+async def _get_openid_config(url: str) -> dict:
+    openid_data = _openid_cache.get(url)
+    if openid_data is not None:
+        return openid_data
+
+    session = get_http_session()
+    async with session.get(url) as resp:
+        if resp.status != 200:
+            raise HTTPException(
+                status_code=resp.status,
+                detail="Failed to fetch OpenID configuration",
+            )
+        openid_data = await resp.json()
+
+    _openid_cache[url] = openid_data
+    return openid_data
+
+
+async def warm_openid_config() -> None:
+    # Prefetch the OpenID discovery document at startup so the first signout
+    # after a cold boot doesn't pay the round-trip inline. Failures just fall
+    # back to the lazy fetch on the request path.
+    if ENABLE_OAUTH_SIGNUP.value and OPENID_PROVIDER_URL.value:
+        try:
+            await _get_openid_config(OPENID_PROVIDER_URL.value)
+        except Exception as e:
+            log.debug(f"OpenID discovery prefetch failed: {e}")
+
+
 ############################
 # GetSessionUser
 ############################
@@ -72,35 +114,36 @@ class SessionUserResponse(Token, UserResponse):
 async def get_session_user(
     request: Request, response: Response, user=Depends(get_current_user)
 ):
+    # Fetch permissions in a worker thread while the token and cookie are built
+    perm_task = asyncio.create_task(
+        asyncio.to_thread(
+            get_permissions, user.id, request.app.state.config.USER_PERMISSIONS
+        )
+    )
+
     expires_delta = parse_duration(request.app.state.config.JWT_EXPIRES_IN)
     expires_at = None
+    max_age = None
     if expires_delta:
-        expires_at = int(time.time()) + int(expires_delta.total_seconds())
+        max_age = int(expires_delta.total_seconds())
+        expires_at = int(time.time()) + max_age
 
     token = create_token(
         data={"id": user.id},
         expires_delta=expires_delta,
     )
 
-    datetime_expires_at = (
-        datetime.datetime.fromtimestamp(expires_at, datetime.timezone.utc)
-        if expires_at
-        else None
-    )
-
     # Set the cookie token
     response.set_cookie(
         key="token",
         value=token,
-        expires=datetime_expires_at,
+        max_age=max_age,
         httponly=True,  # Ensures the cookie is not accessible via JavaScript
         samesite=WEBUI_AUTH_COOKIE_SAME_SITE,
         secure=WEBUI_AUTH_COOKIE_SECURE,
     )
 
-    user_permissions = get_permissions(
-        user.id, request.app.state.config.USER_PERMISSIONS
-    )
+    user_permissions = await perm_task
 
     return {
         "token": token,
@@ -130,6 +173,7 @@ async def update_profile(
             {"profile_image_url": form_data.profile_image_url, "name": form_data.name},
         )
         if user:
+            invalidate_user_cache(user.id)
             return user
         else:
             raise HTTPException(400, detail=ERROR_MESSAGES.DEFAULT())
@@ -149,10 +193,12 @@ async def update_password(
     if WEBUI_AUTH_TRUSTED_EMAIL_HEADER:
         raise HTTPException(400, detail=ERROR_MESSAGES.ACTION_PROHIBITED)
     if session_user:
-        user = Auths.authenticate_user(session_user.email, form_data.password)
+        user = await asyncio.to_thread(
+            Auths.authenticate_user, session_user.email, form_data.password
+        )
 
         if user:
-            hashed = get_password_hash(form_data.new_password)
+            hashed = await get_password_hash_async(form_data.new_password)
             return Auths.update_user_password_by_id(user.id, hashed)
         else:
             raise HTTPException(400, detail=ERROR_MESSAGES.INVALID_PASSWORD)
@@ -161,161 +207,453 @@ async def update_password(
 
 
 ############################
-# LDAP Authentication
+# LDAP Config Snapshot
 ############################
-@router.post("/ldap", response_model=SessionUserResponse)
-async def ldap_auth(request: Request, response: Response, form_data: LdapForm):
-    ENABLE_LDAP = request.app.state.config.ENABLE_LDAP
-    LDAP_SERVER_LABEL = request.app.state.config.LDAP_SERVER_LABEL
-    LDAP_SERVER_HOST = request.app.state.config.LDAP_SERVER_HOST
-    LDAP_SERVER_PORT = request.app.state.config.LDAP_SERVER_PORT
-    LDAP_ATTRIBUTE_FOR_MAIL = request.app.state.config.LDAP_ATTRIBUTE_FOR_MAIL
-    LDAP_ATTRIBUTE_FOR_USERNAME = request.app.state.config.LDAP_ATTRIBUTE_FOR_USERNAME
-    LDAP_SEARCH_BASE = request.app.state.config.LDAP_SEARCH_BASE
-    LDAP_SEARCH_FILTERS = request.app.state.config.LDAP_SEARCH_FILTERS
-    LDAP_APP_DN = request.app.state.config.LDAP_APP_DN
-    LDAP_APP_PASSWORD = request.app.state.config.LDAP_APP_PASSWORD
-    LDAP_USE_TLS = request.app.state.config.LDAP_USE_TLS
-    LDAP_CA_CERT_FILE = request.app.state.config.LDAP_CA_CERT_FILE
-    LDAP_CIPHERS = (
-        request.app.state.config.LDAP_CIPHERS
-        if request.app.state.config.LDAP_CIPHERS
-        else "ALL"
+
+
+# Snapshot the LDAP settings instead of reading a dozen persistent-config
+# attributes on every login. The admin LDAP endpoints invalidate the snapshot
+# when the settings change; a short TTL bounds staleness from writers that
+# bypass them (e.g. /configs/import updating the persistent config directly).
+@dataclass(frozen=True)
+class _LdapConfig:
+    enable: bool
+    label: str
+    host: str
+    port: Optional[int]
+    attribute_for_mail: str
+    attribute_for_username: str
+    search_base: str
+    search_filters: str
+    app_dn: str
+    app_password: str
+    use_tls: bool
+    ca_cert_file: Optional[str]
+    ciphers: str
+    backend: str
+    search_filter_template: str
+    search_attributes: tuple
+
+
+_ldap_config_cache = TTLCache(maxsize=1, ttl=60)
+
+
+def _get_ldap_config(config) -> _LdapConfig:
+    ldap_config = _ldap_config_cache.get("config")
+    if ldap_config is None:
+        attribute_for_mail = config.LDAP_ATTRIBUTE_FOR_MAIL
+        attribute_for_username = config.LDAP_ATTRIBUTE_FOR_USERNAME
+        search_filters = config.LDAP_SEARCH_FILTERS
+
+        ldap_config = _LdapConfig(
+            enable=config.ENABLE_LDAP,
+            label=config.LDAP_SERVER_LABEL,
+            host=config.LDAP_SERVER_HOST,
+            port=config.LDAP_SERVER_PORT,
+            attribute_for_mail=attribute_for_mail,
+            attribute_for_username=attribute_for_username,
+            search_base=config.LDAP_SEARCH_BASE,
+            search_filters=search_filters,
+            app_dn=config.LDAP_APP_DN,
+            app_password=config.LDAP_APP_PASSWORD,
+            use_tls=config.LDAP_USE_TLS,
+            ca_cert_file=config.LDAP_CA_CERT_FILE,
+            ciphers=config.LDAP_CIPHERS if config.LDAP_CIPHERS else "ALL",
+            backend=config.LDAP_BACKEND,
+            # Precomputed per snapshot so the per-request work is a single
+            # substitution of the escaped username
+            search_filter_template=(
+                f"(&({attribute_for_username}={{user}}){search_filters})"
+            ),
+            search_attributes=(attribute_for_username, attribute_for_mail, "cn"),
+        )
+        _ldap_config_cache["config"] = ldap_config
+    return ldap_config
+
+
+def _invalidate_ldap_config() -> None:
+    _ldap_config_cache.clear()
+
+
+############################
+# LDAP Connection Pool
+############################
+
+# Application-bind connections are pooled so concurrent logins amortize the
+# TCP + TLS + bind cost of the search phase instead of paying it per request.
+# User-bind connections stay per-request since they carry user credentials.
+LDAP_CONN_POOL_SIZE = 8
+
+_ldap_app_conn_pool: Optional[asyncio.Queue] = None
+_ldap_app_conn_pool_key: Optional[tuple] = None
+_ldap_app_conn_pool_lock = asyncio.Lock()
+
+
+def _unbind_ldap_connection(connection) -> None:
+    try:
+        connection.unbind()
+    except Exception:
+        pass
+
+
+async def _acquire_ldap_app_connection(server, app_dn, app_password, pool_key):
+    global _ldap_app_conn_pool, _ldap_app_conn_pool_key
+
+    async with _ldap_app_conn_pool_lock:
+        if _ldap_app_conn_pool is None or _ldap_app_conn_pool_key != pool_key:
+            # LDAP settings changed; drop any connections bound with the old ones
+            if _ldap_app_conn_pool is not None:
+                while not _ldap_app_conn_pool.empty():
+                    _unbind_ldap_connection(_ldap_app_conn_pool.get_nowait())
+
+            _ldap_app_conn_pool = asyncio.Queue(maxsize=LDAP_CONN_POOL_SIZE)
+            _ldap_app_conn_pool_key = pool_key
+        pool = _ldap_app_conn_pool
+
+    try:
+        connection = pool.get_nowait()
+    except asyncio.QueueEmpty:
+        connection = None
+
+    if connection is not None:
+        # Validate pooled connections before reuse; the socket may have been
+        # dropped by the server since the last checkout
+        try:
+            if connection.bound or connection.rebind():
+                return connection
+        except Exception:
+            pass
+        _unbind_ldap_connection(connection)
+
+    connection = Connection(
+        server,
+        app_dn,
+        app_password,
+        auto_bind="NONE",
+        authentication="SIMPLE",
     )
+    if not connection.bind():
+        raise HTTPException(400, detail="Application account bind failed")
 
-    if not ENABLE_LDAP:
-        raise HTTPException(400, detail="LDAP authentication is not enabled")
+    return connection
+
+
+def _release_ldap_app_connection(connection) -> None:
+    pool = _ldap_app_conn_pool
+    if pool is not None:
+        try:
+            pool.put_nowait(connection)
+            return
+        except asyncio.QueueFull:
+            pass
+
+    _unbind_ldap_connection(connection)
 
+
+############################
+# LDAP Backends
+############################
+
+
+def _python_ldap_available() -> bool:
+    # python-ldap (libldap) is an optional dependency; the C client is far
+    # faster per operation than pure-python ldap3
+    try:
+        import ldap  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+_python_ldap_conn = None
+_python_ldap_conn_key: Optional[tuple] = None
+# python-ldap connections are not safe for concurrent operations, so access
+# to the shared app connection is serialized
+_python_ldap_lock = threading.Lock()
+
+
+def _python_ldap_uri(cfg: _LdapConfig) -> str:
+    scheme = "ldaps" if cfg.use_tls else "ldap"
+    if cfg.port:
+        return f"{scheme}://{cfg.host}:{cfg.port}"
+    return f"{scheme}://{cfg.host}"
+
+
+def _python_ldap_initialize(cfg: _LdapConfig):
+    import ldap
+
+    connection = ldap.initialize(_python_ldap_uri(cfg))
+    connection.set_option(ldap.OPT_REFERRALS, 0)
+    if cfg.use_tls and cfg.ca_cert_file:
+        connection.set_option(ldap.OPT_X_TLS_CACERTFILE, cfg.ca_cert_file)
+        connection.set_option(ldap.OPT_X_TLS_NEWCTX, 0)
+    return connection
+
+
+def _python_ldap_app_search(cfg: _LdapConfig, search_filter: str):
+    import ldap
+
+    global _python_ldap_conn, _python_ldap_conn_key
+
+    key = (
+        cfg.host,
+        cfg.port,
+        cfg.app_dn,
+        cfg.app_password,
+        cfg.use_tls,
+        cfg.ca_cert_file,
+    )
+
+    with _python_ldap_lock:
+        for attempt in (0, 1):
+            if _python_ldap_conn is None or _python_ldap_conn_key != key:
+                connection = _python_ldap_initialize(cfg)
+                connection.simple_bind_s(cfg.app_dn, cfg.app_password)
+                _python_ldap_conn = connection
+                _python_ldap_conn_key = key
+            try:
+                return _python_ldap_conn.search_ext_s(
+                    cfg.search_base,
+                    ldap.SCOPE_SUBTREE,
+                    search_filter,
+                    attrlist=list(cfg.search_attributes),
+                    sizelimit=2,
+                    timeout=5,
+                )
+            except ldap.SERVER_DOWN:
+                # Dropped socket; rebind once before giving up
+                _python_ldap_conn = None
+                if attempt:
+                    raise
+
+
+def _ldap_search_and_bind(cfg: _LdapConfig, username: str, password: str):
+    """
+    Search for the user and verify their credentials using python-ldap.
+    Returns the (username, email, cn) attributes of the directory entry.
+    """
+    import ldap
+    from ldap.filter import escape_filter_chars as ldap_escape_filter_chars
+
+    search_filter = cfg.search_filter_template.format_map(
+        {"user": ldap_escape_filter_chars(username)}
+    )
+    results = _python_ldap_app_search(cfg, search_filter) or []
+    entries = [(dn, attrs) for dn, attrs in results if dn is not None]
+
+    if len(entries) == 0:
+        raise HTTPException(400, detail="User not found in the LDAP server")
+    if len(entries) != 1:
+        raise HTTPException(
+            400, detail="Ambiguous LDAP search: multiple entries matched"
+        )
+
+    user_dn, attrs = entries[0]
+
+    def attr(name: str) -> str:
+        values = attrs.get(name, [])
+        if not values:
+            return ""
+        value = values[0]
+        return value.decode() if isinstance(value, bytes) else str(value)
+
+    entry_username = attr(cfg.attribute_for_username).lower()
+    if entry_username != username:
+        raise HTTPException(
+            400,
+            f"User {username} does not match the record. Search result: {entry_username}",
+        )
+
+    # Throwaway user-bind connection to verify the credentials
+    connection_user = _python_ldap_initialize(cfg)
+    try:
+        connection_user.simple_bind_s(user_dn, password)
+    except ldap.INVALID_CREDENTIALS:
+        raise HTTPException(400, f"Authentication failed for {username}")
+    finally:
+        try:
+            connection_user.unbind_s()
+        except Exception:
+            pass
+
+    return entry_username, attr(cfg.attribute_for_mail), attr("cn")
+
+
+async def _ldap3_search_and_bind(cfg: _LdapConfig, username: str, password: str):
+    """
+    ldap3 (pure python) implementation of the search + user-bind path.
+    Returns the (username, email, cn) attributes of the directory entry.
+    """
     try:
         tls = Tls(
             validate=CERT_REQUIRED,
             version=PROTOCOL_TLS,
-            ca_certs_file=LDAP_CA_CERT_FILE,
-            ciphers=LDAP_CIPHERS,
+            ca_certs_file=cfg.ca_cert_file,
+            ciphers=cfg.ciphers,
         )
     except Exception as e:
         log.error(f"An error occurred on TLS: {str(e)}")
         raise HTTPException(400, detail=str(e))
 
+    server = Server(
+        host=cfg.host,
+        port=cfg.port,
+        get_info=NONE,
+        use_ssl=cfg.use_tls,
+        tls=tls,
+    )
+    pool_key = (
+        cfg.host,
+        cfg.port,
+        cfg.app_dn,
+        cfg.app_password,
+        cfg.use_tls,
+        cfg.ca_cert_file,
+        cfg.ciphers,
+    )
+    connection_app = await _acquire_ldap_app_connection(
+        server, cfg.app_dn, cfg.app_password, pool_key
+    )
     try:
-        server = Server(
-            host=LDAP_SERVER_HOST,
-            port=LDAP_SERVER_PORT,
-            get_info=NONE,
-            use_ssl=LDAP_USE_TLS,
-            tls=tls,
-        )
-        connection_app = Connection(
-            server,
-            LDAP_APP_DN,
-            LDAP_APP_PASSWORD,
-            auto_bind="NONE",
-            authentication="SIMPLE",
-        )
-        if not connection_app.bind():
-            raise HTTPException(400, detail="Application account bind failed")
-
         search_success = connection_app.search(
-            search_base=LDAP_SEARCH_BASE,
-            search_filter=f"(&({LDAP_ATTRIBUTE_FOR_USERNAME}={escape_filter_chars(form_data.user.lower())}){LDAP_SEARCH_FILTERS})",
-            attributes=[
-                f"{LDAP_ATTRIBUTE_FOR_USERNAME}",
-                f"{LDAP_ATTRIBUTE_FOR_MAIL}",
-                "cn",
-            ],
+            search_base=cfg.search_base,
+            search_filter=cfg.search_filter_template.format_map(
+                {"user": escape_filter_chars(username)}
+            ),
+            attributes=cfg.search_attributes,
+            search_scope=SUBTREE,
+            # Cap what a misconfigured filter can pull over the wire
+            size_limit=2,
+            time_limit=5,
         )
 
-        if not search_success:
+        if not search_success or len(connection_app.entries) == 0:
             raise HTTPException(400, detail="User not found in the LDAP server")
 
+        if len(connection_app.entries) != 1:
+            raise HTTPException(
+                400, detail="Ambiguous LDAP search: multiple entries matched"
+            )
+
         entry = connection_app.entries[0]
-        username = str(entry[f"{LDAP_ATTRIBUTE_FOR_USERNAME}"]).lower()
-        email = str(entry[f"{LDAP_ATTRIBUTE_FOR_MAIL}"])
+    finally:
+        _release_ldap_app_connection(connection_app)
+
+    entry_username = str(entry[cfg.attribute_for_username]).lower()
+    if entry_username != username:
+        raise HTTPException(
+            400,
+            f"User {username} does not match the record. Search result: {str(entry[cfg.attribute_for_username])}",
+        )
+
+    connection_user = Connection(
+        server,
+        entry.entry_dn,
+        password,
+        auto_bind="NONE",
+        authentication="SIMPLE",
+    )
+    try:
+        if not connection_user.bind():
+            raise HTTPException(400, f"Authentication failed for {username}")
+    finally:
+        _unbind_ldap_connection(connection_user)
+
+    return entry_username, str(entry[cfg.attribute_for_mail]), str(entry["cn"])
+
+
+############################
+# LDAP Authentication
+############################
+@router.post("/ldap", response_model=SessionUserResponse)
+async def ldap_auth(request: Request, response: Response, form_data: LdapForm):
+    cfg = _get_ldap_config(request.app.state.config)
+
+    if not cfg.enable:
+        raise HTTPException(400, detail="LDAP authentication is not enabled")
+
+    # An empty password would turn the user bind into an LDAP unauthenticated
+    # bind, which many servers answer with success; reject it up front so both
+    # backends are covered.
+    if not form_data.password or not form_data.password.strip():
+        raise HTTPException(400, detail=ERROR_MESSAGES.INVALID_CRED)
+
+    try:
+        if cfg.backend == "python-ldap" and _python_ldap_available():
+            username, email, cn = await asyncio.to_thread(
+                _ldap_search_and_bind, cfg, form_data.user.lower(), form_data.password
+            )
+        else:
+            username, email, cn = await _ldap3_search_and_bind(
+                cfg, form_data.user.lower(), form_data.password
+            )
+
         if not email or email == "" or email == "[]":
             raise HTTPException(400, f"User {form_data.user} does not have email.")
         else:
             email = email.lower()
 
-        cn = str(entry["cn"])
-        user_dn = entry.entry_dn
-
-        if username == form_data.user.lower():
-            connection_user = Connection(
-                server,
-                user_dn,
-                form_data.password,
-                auto_bind="NONE",
-                authentication="SIMPLE",
-            )
-            if not connection_user.bind():
-                raise HTTPException(400, f"Authentication failed for {form_data.user}")
-
-            user = Users.get_user_by_email(email)
-            if not user:
-                try:
-                    user_count = Users.get_num_users()
-
-                    role = (
-                        "admin"
-                        if user_count == 0
-                        else request.app.state.config.DEFAULT_USER_ROLE
-                    )
+        user = Users.get_user_by_email(email)
+        if not user:
+            try:
+                user_count = Users.get_num_users()
 
-                    user = Auths.insert_new_auth(
-                        email=email,
-                        password=str(uuid.uuid4()),
-                        name=cn,
-                        role=role,
-                    )
+                role = (
+                    "admin"
+                    if user_count == 0
+                    else request.app.state.config.DEFAULT_USER_ROLE
+                )
 
-                    if not user:
-                        raise HTTPException(
-                            500, detail=ERROR_MESSAGES.CREATE_USER_ERROR
-                        )
+                user = Auths.insert_new_auth(
+                    email=email,
+                    password=str(uuid.uuid4()),
+                    name=cn,
+                    role=role,
+                )
 
-                except HTTPException:
-                    raise
-                except Exception as err:
-                    raise HTTPException(500, detail=ERROR_MESSAGES.DEFAULT(err))
+                if not user:
+                    raise HTTPException(500, detail=ERROR_MESSAGES.CREATE_USER_ERROR)
 
+            except HTTPException:
+                raise
+            except Exception as err:
+                raise HTTPException(500, detail=ERROR_MESSAGES.DEFAULT(err))
+        else:
+            # Existing user; re-resolve through the trusted-header path so
+            # inactive accounts are rejected
             user = Auths.authenticate_user_by_trusted_header(email)
 
-            if user:
-                token = create_token(
-                    data={"id": user.id},
-                    expires_delta=parse_duration(
-                        request.app.state.config.JWT_EXPIRES_IN
-                    ),
-                )
+        if user:
+            token = create_token(
+                data={"id": user.id},
+                expires_delta=parse_duration(request.app.state.config.JWT_EXPIRES_IN),
+            )
 
-                # Set the cookie token
-                response.set_cookie(
-                    key="token",
-                    value=token,
-                    httponly=True,  # Ensures the cookie is not accessible via JavaScript
-                )
+            # Set the cookie token
+            response.set_cookie(
+                key="token",
+                value=token,
+                httponly=True,  # Ensures the cookie is not accessible via JavaScript
+            )
 
-                user_permissions = get_permissions(
-                    user.id, request.app.state.config.USER_PERMISSIONS
-                )
+            user_permissions = get_permissions(
+                user.id, request.app.state.config.USER_PERMISSIONS
+            )
 
-                return {
-                    "token": token,
-                    "token_type": "Bearer",
-                    "id": user.id,
-                    "email": user.email,
-                    "name": user.name,
-                    "role": user.role,
-                    "profile_image_url": user.profile_image_url,
-                    "permissions": user_permissions,
-                }
-            else:
-                raise HTTPException(400, detail=ERROR_MESSAGES.INVALID_CRED)
+            return {
+                "token": token,
+                "token_type": "Bearer",
+                "id": user.id,
+                "email": user.email,
+                "name": user.name,
+                "role": user.role,
+                "profile_image_url": user.profile_image_url,
+                "permissions": user_permissions,
+            }
         else:
-            raise HTTPException(
-                400,
-                f"User {form_data.user} does not match the record. Search result: {str(entry[f'{LDAP_ATTRIBUTE_FOR_USERNAME}'])}",
-            )
+            raise HTTPException(400, detail=ERROR_MESSAGES.INVALID_CRED)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(400, detail=str(e))
 
@@ -337,7 +675,7 @@ async def signin(request: Request, response: Response, form_data: SigninForm):
             trusted_name = request.headers.get(
                 WEBUI_AUTH_TRUSTED_NAME_HEADER, trusted_email
             )
-        if not Users.get_user_by_email(trusted_email.lower()):
+        if not Users.get_user_by_email(trusted_email):
             await signup(
                 request,
                 response,
@@ -351,7 +689,9 @@ async def signin(request: Request, response: Response, form_data: SigninForm):
         admin_password = "admin"
 
         if Users.get_user_by_email(admin_email.lower()):
-            user = Auths.authenticate_user(admin_email.lower(), admin_password)
+            user = await asyncio.to_thread(
+                Auths.authenticate_user, admin_email.lower(), admin_password
+            )
         else:
             if Users.get_num_users() != 0:
                 raise HTTPException(400, detail=ERROR_MESSAGES.EXISTING_USERS)
@@ -362,41 +702,46 @@ async def signin(request: Request, response: Response, form_data: SigninForm):
                 SignupForm(email=admin_email, password=admin_password, name="User"),
             )
 
-            user = Auths.authenticate_user(admin_email.lower(), admin_password)
+            user = await asyncio.to_thread(
+                Auths.authenticate_user, admin_email.lower(), admin_password
+            )
     else:
-        user = Auths.authenticate_user(form_data.email.lower(), form_data.password)
+        user = await asyncio.to_thread(
+            Auths.authenticate_user, form_data.email.lower(), form_data.password
+        )
 
     if user:
+        # Fetch permissions in a worker thread while the token and cookie are
+        # built
+        perm_task = asyncio.create_task(
+            asyncio.to_thread(
+                get_permissions, user.id, request.app.state.config.USER_PERMISSIONS
+            )
+        )
 
         expires_delta = parse_duration(request.app.state.config.JWT_EXPIRES_IN)
         expires_at = None
+        max_age = None
         if expires_delta:
-            expires_at = int(time.time()) + int(expires_delta.total_seconds())
+            max_age = int(expires_delta.total_seconds())
+            expires_at = int(time.time()) + max_age
 
         token = create_token(
             data={"id": user.id},
             expires_delta=expires_delta,
         )
 
-        datetime_expires_at = (
-            datetime.datetime.fromtimestamp(expires_at, datetime.timezone.utc)
-            if expires_at
-            else None
-        )
-
         # Set the cookie token
         response.set_cookie(
             key="token",
             value=token,
-            expires=datetime_expires_at,
+            max_age=max_age,
             httponly=True,  # Ensures the cookie is not accessible via JavaScript
             samesite=WEBUI_AUTH_COOKIE_SAME_SITE,
             secure=WEBUI_AUTH_COOKIE_SECURE,
         )
 
-        user_permissions = get_permissions(
-            user.id, request.app.state.config.USER_PERMISSIONS
-        )
+        user_permissions = await perm_task
 
         return {
             "token": token,
@@ -421,6 +766,9 @@ async def signin(request: Request, response: Response, form_data: SigninForm):
 @router.post("/signup", response_model=SessionUserResponse)
 async def signup(request: Request, response: Response, form_data: SignupForm):
 
+    email = form_data.email.lower()
+    user_count = Users.get_num_users()
+
     if WEBUI_AUTH:
         if (
             not request.app.state.config.ENABLE_SIGNUP
@@ -430,20 +778,16 @@ async def signup(request: Request, response: Response, form_data: SignupForm):
                 status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.ACCESS_PROHIBITED
             )
     else:
-        if Users.get_num_users() != 0:
+        if user_count != 0:
             raise HTTPException(
                 status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.ACCESS_PROHIBITED
             )
 
-    user_count = Users.get_num_users()
-    if not validate_email_format(form_data.email.lower()):
+    if not validate_email_format(email):
         raise HTTPException(
             status.HTTP_400_BAD_REQUEST, detail=ERROR_MESSAGES.INVALID_EMAIL_FORMAT
         )
 
-    if Users.get_user_by_email(form_data.email.lower()):
-        raise HTTPException(400, detail=ERROR_MESSAGES.EMAIL_TAKEN)
-
     try:
         role = (
             "admin" if user_count == 0 else request.app.state.config.DEFAULT_USER_ROLE
@@ -452,45 +796,45 @@ async def signup(request: Request, response: Response, form_data: SignupForm):
         if user_count == 0:
             # Disable signup after the first user is created
             request.app.state.config.ENABLE_SIGNUP = False
+            _bump_admin_config_rev()
 
-        hashed = get_password_hash(form_data.password)
-        user = Auths.insert_new_auth(
-            form_data.email.lower(),
+        hashed = await get_password_hash_async(form_data.password)
+        user = Auths.insert_new_auth_if_absent(
+            email,
             hashed,
             form_data.name,
             form_data.profile_image_url,
             role,
         )
 
+        if user is None:
+            raise HTTPException(400, detail=ERROR_MESSAGES.EMAIL_TAKEN)
+
         if user:
             expires_delta = parse_duration(request.app.state.config.JWT_EXPIRES_IN)
             expires_at = None
+            max_age = None
             if expires_delta:
-                expires_at = int(time.time()) + int(expires_delta.total_seconds())
+                max_age = int(expires_delta.total_seconds())
+                expires_at = int(time.time()) + max_age
 
             token = create_token(
                 data={"id": user.id},
                 expires_delta=expires_delta,
             )
 
-            datetime_expires_at = (
-                datetime.datetime.fromtimestamp(expires_at, datetime.timezone.utc)
-                if expires_at
-                else None
-            )
-
             # Set the cookie token
             response.set_cookie(
                 key="token",
                 value=token,
-                expires=datetime_expires_at,
+                max_age=max_age,
                 httponly=True,  # Ensures the cookie is not accessible via JavaScript
                 samesite=WEBUI_AUTH_COOKIE_SAME_SITE,
                 secure=WEBUI_AUTH_COOKIE_SECURE,
             )
 
             if request.app.state.config.WEBHOOK_URL:
-                post_webhook(
+                await post_webhook(
                     request.app.state.WEBUI_NAME,
                     request.app.state.config.WEBHOOK_URL,
                     WEBHOOK_MESSAGES.USER_SIGNUP(user.name),
@@ -518,34 +862,32 @@ async def signup(request: Request, response: Response, form_data: SignupForm):
             }
         else:
             raise HTTPException(500, detail=ERROR_MESSAGES.CREATE_USER_ERROR)
+    except HTTPException:
+        raise
     except Exception as err:
         raise HTTPException(500, detail=ERROR_MESSAGES.DEFAULT(err))
 
 
 @router.get("/signout")
 async def signout(request: Request, response: Response):
+    token = request.cookies.get("token")
+    if token:
+        invalidate_token_cache(token)
+
     response.delete_cookie("token")
 
     if ENABLE_OAUTH_SIGNUP.value:
         oauth_id_token = request.cookies.get("oauth_id_token")
         if oauth_id_token:
             try:
-                async with ClientSession() as session:
-                    async with session.get(OPENID_PROVIDER_URL.value) as resp:
-                        if resp.status == 200:
-                            openid_data = await resp.json()
-                            logout_url = openid_data.get("end_session_endpoint")
-                            if logout_url:
-                                response.delete_cookie("oauth_id_token")
-                                return RedirectResponse(
-                                    headers=response.headers,
-                                    url=f"{logout_url}?id_token_hint={oauth_id_token}",
-                                )
-                        else:
-                            raise HTTPException(
-                                status_code=resp.status,
-                                detail="Failed to fetch OpenID configuration",
-                            )
+                openid_data = await _get_openid_config(OPENID_PROVIDER_URL.value)
+                logout_url = openid_data.get("end_session_endpoint")
+                if logout_url:
+                    response.delete_cookie("oauth_id_token")
+                    return RedirectResponse(
+                        headers=response.headers,
+                        url=f"{logout_url}?id_token_hint={oauth_id_token}",
+                    )
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
@@ -559,24 +901,25 @@ async def signout(request: Request, response: Response):
 
 @router.post("/add", response_model=SigninResponse)
 async def add_user(form_data: AddUserForm, user=Depends(get_admin_user)):
-    if not validate_email_format(form_data.email.lower()):
+    email = form_data.email.lower()
+    if not validate_email_format(email):
         raise HTTPException(
             status.HTTP_400_BAD_REQUEST, detail=ERROR_MESSAGES.INVALID_EMAIL_FORMAT
         )
 
-    if Users.get_user_by_email(form_data.email.lower()):
-        raise HTTPException(400, detail=ERROR_MESSAGES.EMAIL_TAKEN)
-
     try:
-        hashed = get_password_hash(form_data.password)
-        user = Auths.insert_new_auth(
-            form_data.email.lower(),
+        hashed = await get_password_hash_async(form_data.password)
+        user = Auths.insert_new_auth_if_absent(
+            email,
             hashed,
             form_data.name,
             form_data.profile_image_url,
             form_data.role,
         )
 
+        if user is None:
+            raise HTTPException(400, detail=ERROR_MESSAGES.EMAIL_TAKEN)
+
         if user:
             token = create_token(data={"id": user.id})
             return {
@@ -590,6 +933,8 @@ async def add_user(form_data: AddUserForm, user=Depends(get_admin_user)):
             }
         else:
             raise HTTPException(500, detail=ERROR_MESSAGES.CREATE_USER_ERROR)
+    except HTTPException:
+        raise
     except Exception as err:
         raise HTTPException(500, detail=ERROR_MESSAGES.DEFAULT(err))
 
@@ -598,15 +943,21 @@ async def add_user(form_data: AddUserForm, user=Depends(get_admin_user)):
 # GetAdminDetails
 ############################
 
+# Admin identity only changes on config edits; cache it briefly so the
+# endpoint doesn't hit the users table on every page load.
+_admin_details_cache = TTLCache(maxsize=1, ttl=60)
+
 
 @router.get("/admin/details")
 async def get_admin_details(request: Request, user=Depends(get_current_user)):
     if request.app.state.config.SHOW_ADMIN_DETAILS:
+        details = _admin_details_cache.get("details")
+        if details is not None:
+            return details
+
         admin_email = request.app.state.config.ADMIN_EMAIL
         admin_name = None
 
-        log.info(f"Admin details - Email: {admin_email}, Name: {admin_name}")
-
         if admin_email:
             admin = Users.get_user_by_email(admin_email)
             if admin:
@@ -617,10 +968,12 @@ async def get_admin_details(request: Request, user=Depends(get_current_user)):
                 admin_email = admin.email
                 admin_name = admin.name
 
-        return {
+        details = {
             "name": admin_name,
             "email": admin_email,
         }
+        _admin_details_cache["details"] = details
+        return details
     else:
         raise HTTPException(400, detail=ERROR_MESSAGES.ACTION_PROHIBITED)
 
@@ -629,24 +982,43 @@ async def get_admin_details(request: Request, user=Depends(get_current_user)):
 # ToggleSignUp
 ############################
 
+# The admin panel polls GET /admin/config; rebuild the response dict only when
+# the underlying config revision changes. The TTL caps staleness from config
+# writers that don't bump the revision (e.g. /configs/import).
+_admin_config_rev = 0
+_admin_config_cache = TTLCache(maxsize=1, ttl=60)
 
-@router.get("/admin/config")
-async def get_admin_config(request: Request, user=Depends(get_admin_user)):
+
+def _bump_admin_config_rev() -> None:
+    global _admin_config_rev
+    _admin_config_rev += 1
+
+
+def _admin_config_dict(config) -> dict:
     return {
-        "SHOW_ADMIN_DETAILS": request.app.state.config.SHOW_ADMIN_DETAILS,
-        "WEBUI_URL": request.app.state.config.WEBUI_URL,
-        "ENABLE_SIGNUP": request.app.state.config.ENABLE_SIGNUP,
-        "ENABLE_API_KEY": request.app.state.config.ENABLE_API_KEY,
-        "ENABLE_API_KEY_ENDPOINT_RESTRICTIONS": request.app.state.config.ENABLE_API_KEY_ENDPOINT_RESTRICTIONS,
-        "API_KEY_ALLOWED_ENDPOINTS": request.app.state.config.API_KEY_ALLOWED_ENDPOINTS,
-        "ENABLE_CHANNELS": request.app.state.config.ENABLE_CHANNELS,
-        "DEFAULT_USER_ROLE": request.app.state.config.DEFAULT_USER_ROLE,
-        "JWT_EXPIRES_IN": request.app.state.config.JWT_EXPIRES_IN,
-        "ENABLE_COMMUNITY_SHARING": request.app.state.config.ENABLE_COMMUNITY_SHARING,
-        "ENABLE_MESSAGE_RATING": request.app.state.config.ENABLE_MESSAGE_RATING,
+        "SHOW_ADMIN_DETAILS": config.SHOW_ADMIN_DETAILS,
+        "WEBUI_URL": config.WEBUI_URL,
+        "ENABLE_SIGNUP": config.ENABLE_SIGNUP,
+        "ENABLE_API_KEY": config.ENABLE_API_KEY,
+        "ENABLE_API_KEY_ENDPOINT_RESTRICTIONS": config.ENABLE_API_KEY_ENDPOINT_RESTRICTIONS,
+        "API_KEY_ALLOWED_ENDPOINTS": config.API_KEY_ALLOWED_ENDPOINTS,
+        "ENABLE_CHANNELS": config.ENABLE_CHANNELS,
+        "DEFAULT_USER_ROLE": config.DEFAULT_USER_ROLE,
+        "JWT_EXPIRES_IN": config.JWT_EXPIRES_IN,
+        "ENABLE_COMMUNITY_SHARING": config.ENABLE_COMMUNITY_SHARING,
+        "ENABLE_MESSAGE_RATING": config.ENABLE_MESSAGE_RATING,
     }
 
 
+@router.get("/admin/config")
+async def get_admin_config(request: Request, user=Depends(get_admin_user)):
+    cached = _admin_config_cache.get(_admin_config_rev)
+    if cached is None:
+        cached = _admin_config_dict(request.app.state.config)
+        _admin_config_cache[_admin_config_rev] = cached
+    return cached
+
+
 class AdminConfig(BaseModel):
     SHOW_ADMIN_DETAILS: bool
     WEBUI_URL: str
@@ -682,10 +1054,8 @@ async def update_admin_config(
     if form_data.DEFAULT_USER_ROLE in ["pending", "user", "admin"]:
         request.app.state.config.DEFAULT_USER_ROLE = form_data.DEFAULT_USER_ROLE
 
-    pattern = r"^(-1|0|(-?\d+(\.\d+)?)(ms|s|m|h|d|w))$"
-
     # Check if the input string matches the pattern
-    if re.match(pattern, form_data.JWT_EXPIRES_IN):
+    if _JWT_EXPIRES_RE.match(form_data.JWT_EXPIRES_IN):
         request.app.state.config.JWT_EXPIRES_IN = form_data.JWT_EXPIRES_IN
 
     request.app.state.config.ENABLE_COMMUNITY_SHARING = (
@@ -693,19 +1063,10 @@ async def update_admin_config(
     )
     request.app.state.config.ENABLE_MESSAGE_RATING = form_data.ENABLE_MESSAGE_RATING
 
-    return {
-        "SHOW_ADMIN_DETAILS": request.app.state.config.SHOW_ADMIN_DETAILS,
-        "WEBUI_URL": request.app.state.config.WEBUI_URL,
-        "ENABLE_SIGNUP": request.app.state.config.ENABLE_SIGNUP,
-        "ENABLE_API_KEY": request.app.state.config.ENABLE_API_KEY,
-        "ENABLE_API_KEY_ENDPOINT_RESTRICTIONS": request.app.state.config.ENABLE_API_KEY_ENDPOINT_RESTRICTIONS,
-        "API_KEY_ALLOWED_ENDPOINTS": request.app.state.config.API_KEY_ALLOWED_ENDPOINTS,
-        "ENABLE_CHANNELS": request.app.state.config.ENABLE_CHANNELS,
-        "DEFAULT_USER_ROLE": request.app.state.config.DEFAULT_USER_ROLE,
-        "JWT_EXPIRES_IN": request.app.state.config.JWT_EXPIRES_IN,
-        "ENABLE_COMMUNITY_SHARING": request.app.state.config.ENABLE_COMMUNITY_SHARING,
-        "ENABLE_MESSAGE_RATING": request.app.state.config.ENABLE_MESSAGE_RATING,
-    }
+    _admin_details_cache.clear()
+    _bump_admin_config_rev()
+
+    return _admin_config_dict(request.app.state.config)
 
 
 class LdapServerConfig(BaseModel):
@@ -779,6 +1140,8 @@ async def update_ldap_server(
     request.app.state.config.LDAP_CA_CERT_FILE = form_data.certificate_path
     request.app.state.config.LDAP_CIPHERS = form_data.ciphers
 
+    _invalidate_ldap_config()
+
     return {
         "label": request.app.state.config.LDAP_SERVER_LABEL,
         "host": request.app.state.config.LDAP_SERVER_HOST,
@@ -809,6 +1172,7 @@ async def update_ldap_config(
     request: Request, form_data: LdapConfigForm, user=Depends(get_admin_user)
 ):
     request.app.state.config.ENABLE_LDAP = form_data.enable_ldap
+    _invalidate_ldap_config()
     return {"ENABLE_LDAP": request.app.state.config.ENABLE_LDAP}
 
 
@@ -830,6 +1194,8 @@ async def generate_api_key(request: Request, user=Depends(get_current_user)):
     success = Users.update_user_api_key_by_id(user.id, api_key)
 
     if success:
+        invalidate_api_key_cache()
+        invalidate_user_cache(user.id)
         return {
             "api_key": api_key,
         }
@@ -841,6 +1207,9 @@ async def generate_api_key(request: Request, user=Depends(get_current_user)):
 @router.delete("/api_key", response_model=bool)
 async def delete_api_key(user=Depends(get_current_user)):
     success = Users.update_user_api_key_by_id(user.id, None)
+    if success:
+        invalidate_api_key_cache()
+        invalidate_user_cache(user.id)
     return success
 
 
@@ -16,6 +16,7 @@ from open_webui.constants import ERROR_MESSAGES
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 
 from open_webui.utils.auth import get_admin_user, get_verified_user
+from open_webui.utils.access_control import bump_permissions_revision
 from open_webui.env import SRC_LOG_LEVELS
 
 
@@ -47,6 +48,7 @@ async def create_new_group(form_data: GroupForm, user=Depends(get_admin_user)):
     try:
         group = Groups.insert_new_group(user.id, form_data)
         if group:
+            bump_permissions_revision()
             return group
         else:
             raise HTTPException(
@@ -93,6 +95,7 @@ async def update_group_by_id(
 
         group = Groups.update_group_by_id(id, form_data)
         if group:
+            bump_permissions_revision()
             return group
         else:
             raise HTTPException(
@@ -117,6 +120,7 @@ async def delete_group_by_id(id: str, user=Depends(get_admin_user)):
     try:
         result = Groups.delete_group_by_id(id)
         if result:
+            bump_permissions_revision()
             return result
         else:
             raise HTTPException(
@@ -17,7 +17,14 @@ from open_webui.constants import ERROR_MESSAGES
 from open_webui.env import SRC_LOG_LEVELS
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel
-from open_webui.utils.auth import get_admin_user, get_password_hash, get_verified_user
+from open_webui.utils.auth import (
+    get_admin_user,
+    get_password_hash,
+    get_verified_user,
+    invalidate_api_key_cache,
+    invalidate_user_cache,
+)
+from open_webui.utils.access_control import bump_permissions_revision
 
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MODELS"])
@@ -108,6 +115,7 @@ async def update_user_permissions(
     request: Request, form_data: UserPermissions, user=Depends(get_admin_user)
 ):
     request.app.state.config.USER_PERMISSIONS = form_data.model_dump()
+    bump_permissions_revision()
     return request.app.state.config.USER_PERMISSIONS
 
 
@@ -119,7 +127,9 @@ async def update_user_permissions(
 @router.post("/update/role", response_model=Optional[UserModel])
 async def update_user_role(form_data: UserRoleUpdateForm, user=Depends(get_admin_user)):
     if user.id != form_data.id and form_data.id != Users.get_first_user().id:
-        return Users.update_user_role_by_id(form_data.id, form_data.role)
+        updated_user = Users.update_user_role_by_id(form_data.id, form_data.role)
+        invalidate_user_cache(form_data.id)
+        return updated_user
 
     raise HTTPException(
         status_code=status.HTTP_403_FORBIDDEN,
@@ -155,6 +165,7 @@ async def update_user_settings_by_session_user(
 ):
     user = Users.update_user_settings_by_id(user.id, form_data.model_dump())
     if user:
+        invalidate_user_cache(user.id)
         return user.settings
     else:
         raise HTTPException(
@@ -196,6 +207,7 @@ async def update_user_info_by_session_user(
 
         user = Users.update_user_by_id(user.id, {"info": {**user.info, **form_data}})
         if user:
+            invalidate_user_cache(user.id)
             return user.info
         else:
             raise HTTPException(
@@ -290,6 +302,7 @@ async def update_user_by_id(
         )
 
         if updated_user:
+            invalidate_user_cache(user_id)
             return updated_user
 
         raise HTTPException(
@@ -314,6 +327,8 @@ async def delete_user_by_id(user_id: str, user=Depends(get_admin_user)):
         result = Auths.delete_auth_by_id(user_id)
 
         if result:
+            invalidate_user_cache(user_id)
+            invalidate_api_key_cache()
             return True
 
         raise HTTPException(
@@ -4,7 +4,24 @@ from open_webui.models.groups import Groups
 
 
 from open_webui.config import DEFAULT_USER_PERMISSIONS
-import json
+from cachetools import TTLCache
+import orjson
+import threading
+
+
+# Computed permissions only change when group membership/permissions or the
+# default user permissions do; cache them briefly and key entries by a
+# revision that mutation endpoints bump so changes show up immediately.
+# get_permissions runs both on the event loop and in worker threads, so the
+# cache is guarded by a lock.
+_permissions_cache = TTLCache(maxsize=10000, ttl=30)
+_permissions_cache_lock = threading.Lock()
+_permissions_revision = 0
+
+
+def bump_permissions_revision() -> None:
+    global _permissions_revision
+    _permissions_revision += 1
 
 
 def fill_missing_permissions(
@@ -35,6 +52,13 @@ def get_permissions(
     Permissions are nested in a dict with the permission key as the key and a boolean as the value.
     """
 
+    cache_key = (user_id, _permissions_revision)
+    with _permissions_cache_lock:
+        cached = _permissions_cache.get(cache_key)
+    if cached is not None:
+        # Return a copy so callers can't mutate the cached entry
+        return orjson.loads(orjson.dumps(cached))
+
     def combine_permissions(
         permissions: Dict[str, Any], group_permissions: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -56,7 +80,7 @@ def get_permissions(
     user_groups = Groups.get_groups_by_member_id(user_id)
 
     # Deep copy default permissions to avoid modifying the original dict
-    permissions = json.loads(json.dumps(default_permissions))
+    permissions = orjson.loads(orjson.dumps(default_permissions))
 
     # Combine permissions from all user groups
     for group in user_groups:
@@ -66,7 +90,11 @@ def get_permissions(
     # Ensure all fields from default_permissions are present and filled in
     permissions = fill_missing_permissions(permissions, default_permissions)
 
-    return permissions
+    with _permissions_cache_lock:
+        _permissions_cache[cache_key] = permissions
+    # Return a copy on the miss path too, so the first caller can't mutate
+    # the entry that later hits will be served from
+    return orjson.loads(orjson.dumps(permissions))
 
 
 def has_permission(
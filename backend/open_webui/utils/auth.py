@@ -1,20 +1,28 @@
+import asyncio
 import logging
-import uuid
+import secrets
 import jwt
 import base64
 import hmac
 import hashlib
-import requests
+import aiohttp
+import orjson
 import os
+import threading
+import time
+
+from cachetools import TTLCache
 
 
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Union, List, Dict
 
 from open_webui.models.users import Users
 
 from open_webui.constants import ERROR_MESSAGES
 from open_webui.env import (
+    BCRYPT_ROUNDS,
     WEBUI_SECRET_KEY,
     TRUSTED_SIGNATURE_KEY,
     STATIC_DIR,
@@ -34,22 +42,157 @@ log.setLevel(SRC_LOG_LEVELS["OAUTH"])
 SESSION_SECRET = WEBUI_SECRET_KEY
 ALGORITHM = "HS256"
 
+# Hoisted so jwt.decode doesn't rebuild them per call
+_JWT_ALGORITHMS = (ALGORITHM,)
+_JWT_OPTIONS = {"verify_signature": True, "verify_exp": True}
+
 ##############
 # Auth Utils
 ##############
 
+# Short-lived cache of token -> user id resolutions so hot paths skip the JWT
+# verification on every request within the TTL window.
+_TOKEN_CACHE_TTL = 30
+_TOKEN_CACHE_MAX_TTL = 60
+
+_token_cache = TTLCache(maxsize=10000, ttl=_TOKEN_CACHE_TTL)
+_token_cache_lock = threading.Lock()
+
+# User rows and api-key resolutions, keyed by user id and api-key digest
+# respectively; saves the users SELECT per request. Endpoints that mutate
+# users invalidate these so changes apply immediately.
+_user_cache = TTLCache(maxsize=5000, ttl=60)
+_api_key_cache = TTLCache(maxsize=5000, ttl=60)
+_user_cache_lock = threading.Lock()
+
+
+# Pending last-active stamps, flushed to the users table in one transaction
+# by flush_last_active() instead of issuing an UPDATE per request. Stamps are
+# also debounced per user so sustained traffic from one user produces a write
+# every debounce window rather than every flush.
+_LAST_ACTIVE_FLUSH_INTERVAL = 5
+_LAST_ACTIVE_DEBOUNCE = 30
+
+_last_active_pending: Dict[str, int] = {}
+_last_active_written = TTLCache(maxsize=10000, ttl=_LAST_ACTIVE_DEBOUNCE)
+_last_active_lock = threading.Lock()
+
+
+def _note_user_active(user_id: str) -> None:
+    now = int(time.time())
+    with _last_active_lock:
+        if now - _last_active_written.get(user_id, 0) < _LAST_ACTIVE_DEBOUNCE:
+            return
+        _last_active_pending[user_id] = now
+
+
+def flush_last_active() -> None:
+    now = int(time.time())
+    with _last_active_lock:
+        if not _last_active_pending:
+            return
+        pending = dict(_last_active_pending)
+        _last_active_pending.clear()
+        for user_id in pending:
+            _last_active_written[user_id] = now
+
+    Users.update_users_last_active(pending)
+
+
+async def periodic_last_active_flush():
+    while True:
+        await asyncio.sleep(_LAST_ACTIVE_FLUSH_INTERVAL)
+        try:
+            await asyncio.to_thread(flush_last_active)
+        except Exception:
+            log.exception("Failed to flush last-active timestamps")
+
+
+def _get_token_cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
+def invalidate_token_cache(token: str) -> None:
+    with _token_cache_lock:
+        _token_cache.pop(_get_token_cache_key(token), None)
+
+
+def invalidate_user_cache(user_id: str) -> None:
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+
+def invalidate_api_key_cache() -> None:
+    with _user_cache_lock:
+        _api_key_cache.clear()
+
+
+def _get_user_by_id_cached(user_id: str):
+    with _user_cache_lock:
+        user = _user_cache.get(user_id)
+
+    if user is None:
+        user = Users.get_user_by_id(user_id)
+        if user is not None:
+            with _user_cache_lock:
+                _user_cache[user_id] = user
+
+    return user
+
+
+def _get_cached_user(token: str):
+    key = _get_token_cache_key(token)
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+
+    if entry is None:
+        return None
+
+    user_id, expires_at = entry
+    if expires_at is not None and expires_at <= time.time():
+        with _token_cache_lock:
+            _token_cache.pop(key, None)
+        return None
+
+    return _get_user_by_id_cached(user_id)
+
+
+def _cache_user(token: str, user, exp: Optional[int] = None) -> None:
+    # Bound the entry by the token's own expiry so revoked or expired tokens
+    # never outlive their claims.
+    expires_at = time.time() + _TOKEN_CACHE_MAX_TTL
+    if exp is not None:
+        expires_at = min(expires_at, exp)
+
+    with _token_cache_lock:
+        _token_cache[_get_token_cache_key(token)] = (user.id, expires_at)
+    with _user_cache_lock:
+        _user_cache[user.id] = user
+
+
+# Pre-keyed HMAC state cloned per verification so the ipad/opad key expansion
+# runs once at import instead of on every call. Built under the same guard as
+# the old per-call hmac.new so a non-bytes key keeps failing verification.
+try:
+    _hmac_template = hmac.new(TRUSTED_SIGNATURE_KEY, b"", hashlib.sha256)
+except Exception:
+    _hmac_template = None
+
 
 def verify_signature(payload: str, signature: str) -> bool:
     """
     Verifies the HMAC signature of the received payload.
     """
+    if _hmac_template is None:
+        return False
+
     try:
-        expected_signature = base64.b64encode(
-            hmac.new(TRUSTED_SIGNATURE_KEY, payload.encode(), hashlib.sha256).digest()
-        ).decode()
+        mac = _hmac_template.copy()
+        mac.update(payload.encode())
 
-        # Compare securely to prevent timing attacks
-        return hmac.compare_digest(expected_signature, signature)
+        # Decode the provided signature and compare raw digests; still
+        # constant-time via compare_digest, malformed input returns False
+        return hmac.compare_digest(mac.digest(), base64.b64decode(signature))
 
     except Exception:
         return False
@@ -68,17 +211,21 @@ def override_static(path: str, content: str):
         f.write(base64.b64decode(content))  # Convert Base64 back to raw binary
 
 
-def get_license_data(app, key):
+async def get_license_data(app, key):
     if key:
         try:
-            res = requests.post(
-                "https://api.openwebui.com/api/v1/license/",
-                json={"key": key, "version": "1"},
-                timeout=5,
-            )
-
-            if getattr(res, "ok", False):
-                payload = getattr(res, "json", lambda: {})()
+            async with aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as session:
+                async with session.post(
+                    "https://api.openwebui.com/api/v1/license/",
+                    json={"key": key, "version": "1"},
+                ) as res:
+                    ok = res.status < 400
+                    payload = orjson.loads(await res.read()) if ok else {}
+                    text = await res.text() if not ok else ""
+
+            if ok:
                 for k, v in payload.items():
                     if k == "resources":
                         for p, c in v.items():
@@ -91,28 +238,79 @@ def get_license_data(app, key):
                         setattr(app.state, "LICENSE_METADATA", v)
                 return True
             else:
-                log.error(
-                    f"License: retrieval issue: {getattr(res, 'text', 'unknown error')}"
-                )
+                log.error(f"License: retrieval issue: {text or 'unknown error'}")
         except Exception as ex:
             log.exception(f"License: Uncaught Exception: {ex}")
     return False
 
 
 bearer_security = HTTPBearer(auto_error=False)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt stays the default scheme so existing hashes keep verifying; argon2
+# hashes are accepted and re-hashed on the next successful login. The cost
+# factor is operator-tunable via BCRYPT_ROUNDS.
+pwd_context = CryptContext(
+    schemes=["bcrypt", "argon2"],
+    deprecated="auto",
+    bcrypt__rounds=BCRYPT_ROUNDS,
+    bcrypt__ident="2b",
+)
+
+
+# Recently-rejected (hash, password) pairs, remembered briefly so brute-force
+# retries of the same wrong credential skip the bcrypt verify. Keys are HMAC
+# digests, so raw passwords never sit in memory; successful verifications are
+# never cached.
+_recent_bad_credentials = TTLCache(maxsize=10000, ttl=10)
+_bad_credentials_lock = threading.Lock()
+
+
+def _bad_credential_key(plain_password: str, hashed_password: str) -> bytes:
+    mac = hmac.new(SESSION_SECRET.encode(), hashed_password.encode(), hashlib.sha256)
+    mac.update(b"\x00")
+    mac.update(plain_password.encode())
+    return mac.digest()
 
 
 def verify_password(plain_password, hashed_password):
-    return (
-        pwd_context.verify(plain_password, hashed_password) if hashed_password else None
-    )
+    valid, _ = verify_password_and_update(plain_password, hashed_password)
+    return valid
+
+
+def verify_password_and_update(plain_password, hashed_password):
+    """
+    Verify a password and return (valid, new_hash), where new_hash is a
+    replacement hash when the stored one uses a deprecated scheme (e.g.
+    argon2) and should be re-written by the caller.
+    """
+    if not hashed_password:
+        return None, None
+
+    key = _bad_credential_key(plain_password, hashed_password)
+    with _bad_credentials_lock:
+        if key in _recent_bad_credentials:
+            return False, None
+
+    valid, new_hash = pwd_context.verify_and_update(plain_password, hashed_password)
+    if not valid:
+        with _bad_credentials_lock:
+            _recent_bad_credentials[key] = True
+    return valid, new_hash
+
+
+async def verify_password_async(plain_password, hashed_password):
+    # bcrypt verification is CPU-heavy; run it off the event loop so
+    # concurrent logins don't serialize unrelated requests
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
 
 
 def get_password_hash(password):
     return pwd_context.hash(password)
 
 
+async def get_password_hash_async(password):
+    return await asyncio.to_thread(get_password_hash, password)
+
+
 def create_token(data: dict, expires_delta: Union[timedelta, None] = None) -> str:
     payload = data.copy()
 
@@ -124,29 +322,63 @@ def create_token(data: dict, expires_delta: Union[timedelta, None] = None) -> st
     return encoded_jwt
 
 
+# Verified JWT payloads keyed by token digest; skips the HMAC verify + JSON
+# parse for repeat uses of the same token. Tokens that fail verification are
+# negative-cached very briefly so garbage-token floods don't hit the crypto
+# path on every attempt.
+_decoded_token_cache = TTLCache(maxsize=10000, ttl=_TOKEN_CACHE_TTL)
+_bad_token_cache = TTLCache(maxsize=10000, ttl=2)
+_decoded_token_cache_lock = threading.Lock()
+
+
 def decode_token(token: str) -> Optional[dict]:
+    key = _get_token_cache_key(token)
+    with _decoded_token_cache_lock:
+        if key in _bad_token_cache:
+            return None
+        entry = _decoded_token_cache.get(key)
+
+    if entry is not None:
+        decoded, expires_at = entry
+        if expires_at is None or expires_at > time.time():
+            return decoded
+        with _decoded_token_cache_lock:
+            _decoded_token_cache.pop(key, None)
+
     try:
-        decoded = jwt.decode(token, SESSION_SECRET, algorithms=[ALGORITHM])
-        return decoded
+        decoded = jwt.decode(
+            token, SESSION_SECRET, algorithms=_JWT_ALGORITHMS, options=_JWT_OPTIONS
+        )
     except Exception:
+        with _decoded_token_cache_lock:
+            _bad_token_cache[key] = True
         return None
 
+    with _decoded_token_cache_lock:
+        _decoded_token_cache[key] = (decoded, decoded.get("exp"))
+    return decoded
+
 
 def extract_token_from_auth_header(auth_header: str):
-    return auth_header[len("Bearer ") :]
+    return auth_header.removeprefix("Bearer ")
 
 
 def create_api_key():
-    key = str(uuid.uuid4()).replace("-", "")
-    return f"sk-{key}"
+    return f"sk-{secrets.token_hex(16)}"
+
+
+@lru_cache(maxsize=4)
+def _parse_allowed_endpoints(raw: str) -> frozenset:
+    # Keyed on the raw config string, so config updates naturally miss the
+    # cache and reparse
+    return frozenset(path.strip() for path in raw.split(","))
 
 
 def get_http_authorization_cred(auth_header: str):
-    try:
-        scheme, credentials = auth_header.split(" ")
-        return HTTPAuthorizationCredentials(scheme=scheme, credentials=credentials)
-    except Exception:
+    scheme, _, credentials = auth_header.partition(" ")
+    if not credentials:
         raise ValueError(ERROR_MESSAGES.INVALID_TOKEN)
+    return HTTPAuthorizationCredentials(scheme=scheme, credentials=credentials)
 
 
 def get_current_user(
@@ -159,7 +391,7 @@ def get_current_user(
     if auth_token is not None:
         token = auth_token.credentials
 
-    if token is None and "token" in request.cookies:
+    if token is None:
         token = request.cookies.get("token")
 
     if token is None:
@@ -173,12 +405,9 @@ def get_current_user(
             )
 
         if request.app.state.config.ENABLE_API_KEY_ENDPOINT_RESTRICTIONS:
-            allowed_paths = [
-                path.strip()
-                for path in str(
-                    request.app.state.config.API_KEY_ALLOWED_ENDPOINTS
-                ).split(",")
-            ]
+            allowed_paths = _parse_allowed_endpoints(
+                str(request.app.state.config.API_KEY_ALLOWED_ENDPOINTS)
+            )
 
             if request.url.path not in allowed_paths:
                 raise HTTPException(
@@ -188,6 +417,11 @@ def get_current_user(
         return get_current_user_by_api_key(token)
 
     # auth by jwt token
+    user = _get_cached_user(token)
+    if user is not None:
+        _note_user_active(user.id)
+        return user
+
     try:
         data = decode_token(token)
     except Exception as e:
@@ -204,10 +438,11 @@ def get_current_user(
                 detail=ERROR_MESSAGES.INVALID_TOKEN,
             )
         else:
-            # Refresh the user's last active timestamp asynchronously
-            # to prevent blocking the request
-            if background_tasks:
-                background_tasks.add_task(Users.update_user_last_active_by_id, user.id)
+            _cache_user(token, user, data.get("exp"))
+
+            # Refresh the user's last active timestamp from the periodic
+            # flusher instead of blocking the request on an UPDATE
+            _note_user_active(user.id)
         return user
     else:
         raise HTTPException(
@@ -217,7 +452,18 @@ def get_current_user(
 
 
 def get_current_user_by_api_key(api_key: str):
-    user = Users.get_user_by_api_key(api_key)
+    key = _get_token_cache_key(api_key)
+    with _user_cache_lock:
+        user_id = _api_key_cache.get(key)
+
+    user = _get_user_by_id_cached(user_id) if user_id is not None else None
+
+    if user is None:
+        user = Users.get_user_by_api_key(api_key)
+        if user is not None:
+            with _user_cache_lock:
+                _api_key_cache[key] = user.id
+                _user_cache[user.id] = user
 
     if user is None:
         raise HTTPException(
@@ -225,13 +471,16 @@ def get_current_user_by_api_key(api_key: str):
             detail=ERROR_MESSAGES.INVALID_TOKEN,
         )
     else:
-        Users.update_user_last_active_by_id(user.id)
+        _note_user_active(user.id)
 
     return user
 
 
+_VERIFIED_ROLES = frozenset({"user", "admin"})
+
+
 def get_verified_user(user=Depends(get_current_user)):
-    if user.role not in {"user", "admin"}:
+    if user.role not in _VERIFIED_ROLES:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=ERROR_MESSAGES.ACCESS_PROHIBITED,
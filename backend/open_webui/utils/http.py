@@ -0,0 +1,23 @@
+from typing import Optional
+
+from aiohttp import ClientSession
+
+
+# One pooled session for outbound HTTP calls (OpenID discovery, webhooks,
+# OAuth profile fetches) so repeat calls to the same hosts reuse TCP + TLS
+# connections instead of paying the handshake per call.
+_session: Optional[ClientSession] = None
+
+
+def get_http_session() -> ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = ClientSession()
+    return _session
+
+
+async def close_http_session() -> None:
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
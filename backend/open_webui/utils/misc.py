@@ -4,6 +4,7 @@ import time
 import uuid
 import logging
 from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 import json
@@ -321,7 +322,10 @@ def extract_folders_after_data_docs(path):
     return tags
 
 
+@lru_cache(maxsize=32)
 def parse_duration(duration: str) -> Optional[timedelta]:
+    # The parsed timedelta for a given string never changes; this is called
+    # per login/session request with the configured JWT_EXPIRES_IN value
     if duration == "-1" or duration == "0":
         return None
 
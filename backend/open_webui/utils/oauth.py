@@ -4,7 +4,6 @@ import mimetypes
 import sys
 import uuid
 
-import aiohttp
 from authlib.integrations.starlette_client import OAuth
 from authlib.oidc.core import UserInfo
 from fastapi import (
@@ -41,8 +40,13 @@ from open_webui.env import (
     WEBUI_AUTH_COOKIE_SAME_SITE,
     WEBUI_AUTH_COOKIE_SECURE,
 )
+from open_webui.utils.http import get_http_session
 from open_webui.utils.misc import parse_duration
-from open_webui.utils.auth import get_password_hash, create_token
+from open_webui.utils.auth import (
+    get_password_hash,
+    create_token,
+    invalidate_user_cache,
+)
 from open_webui.utils.webhook import post_webhook
 
 from open_webui.env import SRC_LOG_LEVELS, GLOBAL_LOG_LEVEL
@@ -254,31 +258,27 @@ class OAuthManager:
                 try:
                     access_token = token.get("access_token")
                     headers = {"Authorization": f"Bearer {access_token}"}
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(
-                            "https://api.github.com/user/emails", headers=headers
-                        ) as resp:
-                            if resp.ok:
-                                emails = await resp.json()
-                                # use the primary email as the user's email
-                                primary_email = next(
-                                    (e["email"] for e in emails if e.get("primary")),
-                                    None,
-                                )
-                                if primary_email:
-                                    email = primary_email
-                                else:
-                                    log.warning(
-                                        "No primary email found in GitHub response"
-                                    )
-                                    raise HTTPException(
-                                        400, detail=ERROR_MESSAGES.INVALID_CRED
-                                    )
+                    session = get_http_session()
+                    async with session.get(
+                        "https://api.github.com/user/emails", headers=headers
+                    ) as resp:
+                        if resp.ok:
+                            emails = await resp.json()
+                            # use the primary email as the user's email
+                            primary_email = next(
+                                (e["email"] for e in emails if e.get("primary")),
+                                None,
+                            )
+                            if primary_email:
+                                email = primary_email
                             else:
-                                log.warning("Failed to fetch GitHub email")
+                                log.warning("No primary email found in GitHub response")
                                 raise HTTPException(
                                     400, detail=ERROR_MESSAGES.INVALID_CRED
                                 )
+                        else:
+                            log.warning("Failed to fetch GitHub email")
+                            raise HTTPException(400, detail=ERROR_MESSAGES.INVALID_CRED)
                 except Exception as e:
                     log.warning(f"Error fetching GitHub email: {e}")
                     raise HTTPException(400, detail=ERROR_MESSAGES.INVALID_CRED)
@@ -305,12 +305,14 @@ class OAuthManager:
                 user = Users.get_user_by_email(email)
                 if user:
                     # Update the user with the new oauth sub
-                    Users.update_user_oauth_sub_by_id(user.id, provider_sub)
+                    if Users.update_user_oauth_sub_by_id(user.id, provider_sub):
+                        user.oauth_sub = provider_sub
 
         if user:
             determined_role = self.get_user_role(user, user_data)
             if user.role != determined_role:
                 Users.update_user_role_by_id(user.id, determined_role)
+                invalidate_user_cache(user.id)
 
         if not user:
             user_count = Users.get_num_users()
@@ -335,22 +337,20 @@ class OAuthManager:
                             get_kwargs["headers"] = {
                                 "Authorization": f"Bearer {access_token}",
                             }
-                        async with aiohttp.ClientSession() as session:
-                            async with session.get(picture_url, **get_kwargs) as resp:
-                                if resp.ok:
-                                    picture = await resp.read()
-                                    base64_encoded_picture = base64.b64encode(
-                                        picture
-                                    ).decode("utf-8")
-                                    guessed_mime_type = mimetypes.guess_type(
-                                        picture_url
-                                    )[0]
-                                    if guessed_mime_type is None:
-                                        # assume JPG, browsers are tolerant enough of image formats
-                                        guessed_mime_type = "image/jpeg"
-                                    picture_url = f"data:{guessed_mime_type};base64,{base64_encoded_picture}"
-                                else:
-                                    picture_url = "/user.png"
+                        session = get_http_session()
+                        async with session.get(picture_url, **get_kwargs) as resp:
+                            if resp.ok:
+                                picture = await resp.read()
+                                base64_encoded_picture = base64.b64encode(
+                                    picture
+                                ).decode("utf-8")
+                                guessed_mime_type = mimetypes.guess_type(picture_url)[0]
+                                if guessed_mime_type is None:
+                                    # assume JPG, browsers are tolerant enough of image formats
+                                    guessed_mime_type = "image/jpeg"
+                                picture_url = f"data:{guessed_mime_type};base64,{base64_encoded_picture}"
+                            else:
+                                picture_url = "/user.png"
                     except Exception as e:
                         log.error(
                             f"Error downloading profile image '{picture_url}': {e}"
@@ -380,7 +380,7 @@ class OAuthManager:
                 )
 
                 if auth_manager_config.WEBHOOK_URL:
-                    post_webhook(
+                    await post_webhook(
                         WEBUI_NAME,
                         auth_manager_config.WEBHOOK_URL,
                         WEBHOOK_MESSAGES.USER_SIGNUP(user.name),
@@ -1,15 +1,15 @@
 import json
 import logging
 
-import requests
 from open_webui.config import WEBUI_FAVICON_URL
+from open_webui.utils.http import get_http_session
 from open_webui.env import SRC_LOG_LEVELS, VERSION
 
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["WEBHOOK"])
 
 
-def post_webhook(name: str, url: str, message: str, event_data: dict) -> bool:
+async def post_webhook(name: str, url: str, message: str, event_data: dict) -> bool:
     try:
         log.debug(f"post_webhook: {url}, {message}, {event_data}")
         payload = {}
@@ -51,9 +51,10 @@ def post_webhook(name: str, url: str, message: str, event_data: dict) -> bool:
             payload = {**event_data}
 
         log.debug(f"payload: {payload}")
-        r = requests.post(url, json=payload)
-        r.raise_for_status()
-        log.debug(f"r.text: {r.text}")
+        session = get_http_session()
+        async with session.post(url, json=payload) as r:
+            r.raise_for_status()
+            log.debug(f"r.text: {await r.text()}")
         return True
     except Exception as e:
         log.exception(e)